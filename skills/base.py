@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 import re
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillConfig:
     """
     Skill configuration parsed from SKILL.md frontmatter.
@@ -35,9 +35,42 @@ class SkillConfig:
     def __post_init__(self):
         # Normalize trigger keywords to lowercase
         self.triggers = [t.lower().strip() for t in self.triggers]
+    
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        name: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> "SkillConfig":
+        """
+        Create a SkillConfig from a configuration dictionary.
+        
+        Args:
+            data: Dictionary with skill configuration (frontmatter or YAML)
+            name: Fallback name if the dictionary does not define one
+            category: Fallback category if the dictionary does not define one
+            
+        Returns:
+            SkillConfig instance
+        """
+        # Copy the list so the config never shares it with the source
+        # dict, which may be a memoized YAML document
+        allowed_tools = data.get("allowed_tools")
+        if isinstance(allowed_tools, list):
+            allowed_tools = list(allowed_tools)
+        
+        return cls(
+            name=data.get("name", name),
+            description=data.get("description", ""),
+            triggers=data.get("triggers", []),
+            allowed_tools=allowed_tools,
+            priority=data.get("priority", 0),
+            category=data.get("category", category),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillContext:
     """
     Context passed to skills during execution.
@@ -76,6 +109,11 @@ class BaseSkill(ABC):
                 return self._keyword_match_score(query, code_keywords)
     """
     
+    # Activation score indexed by number of matched triggers. Any single
+    # match gives a base score of 0.5 so that skills with many triggers
+    # still activate; three or more matches score 0.8 rising to 1.0.
+    MATCH_SCORES = (0.0, 0.5, 0.7)
+    
     def __init__(self, config: SkillConfig, content: str = ""):
         """
         Initialize a skill with its configuration.
@@ -124,29 +162,18 @@ class BaseSkill(ABC):
         Returns:
             Float between 0.0 (not relevant) and 1.0 (highly relevant)
         """
-        query_lower = query.lower()
+        # Patterns are compiled case-insensitive, so the query is
+        # searched as-is rather than lowercased on every call
         matched = 0
         
         for pattern in self._compiled_triggers:
-            if pattern.search(query_lower):
+            if pattern.search(query):
                 matched += 1
         
-        if not self._compiled_triggers or matched == 0:
-            return 0.0
-        
-        # Any single match gives a base score of 0.5
-        # Multiple matches increase score up to 1.0
-        # This ensures skills with many triggers still activate on a single match
-        if matched == 1:
-            base_score = 0.5
-        elif matched == 2:
-            base_score = 0.7
-        elif matched >= 3:
-            base_score = min(1.0, 0.8 + (matched - 3) * 0.05)
-        else:
-            base_score = 0.0
+        if matched < len(self.MATCH_SCORES):
+            return self.MATCH_SCORES[matched]
         
-        return base_score
+        return min(1.0, 0.8 + (matched - 3) * 0.05)
     
     def get_matched_triggers(self, query: str) -> List[str]:
         """
@@ -158,11 +185,10 @@ class BaseSkill(ABC):
         Returns:
             List of trigger strings that matched
         """
-        query_lower = query.lower()
         matched = []
         
         for i, pattern in enumerate(self._compiled_triggers):
-            if pattern.search(query_lower):
+            if pattern.search(query):
                 matched.append(self.config.triggers[i])
         
         return matched
@@ -263,14 +289,7 @@ class ConfigSkill(BaseSkill):
             if not name:
                 return None
             
-            skill_config = SkillConfig(
-                name=name,
-                description=config_dict.get("description", ""),
-                triggers=config_dict.get("triggers", []),
-                allowed_tools=config_dict.get("allowed_tools"),
-                priority=config_dict.get("priority", 0),
-                category=config_dict.get("category", "custom"),
-            )
+            skill_config = SkillConfig.from_dict(config_dict, category="custom")
             
             instructions = config_dict.get("instructions", "")
             
@@ -9,14 +9,31 @@ YAML frontmatter configuration.
 import os
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from skills.base import BaseSkill, MarkdownSkill, ConfigSkill, SkillConfig, SkillContext
 
 
-@dataclass
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_string(yaml_string: str) -> Any:
+    """
+    Parse a YAML string, memoizing the result.
+    
+    The custom skills parameter is sent unchanged with every invocation
+    of a workflow node, so it is only parsed once. Callers must treat
+    the returned documents as read-only.
+    """
+    return yaml.load(yaml_string, Loader=_YAML_LOADER)
+
+
+@dataclass(slots=True)
 class SkillMatch:
     """
     Represents a matched skill with its activation score.
@@ -52,6 +69,9 @@ class SkillLoader:
     SKILL_FILENAME = "SKILL.md"
     CONFIG_FILENAME = "config.yaml"
     
+    # Matches frontmatter between --- delimiters
+    FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+    
     def __init__(self, skills_dir: Optional[str] = None):
         """
         Initialize the skill loader.
@@ -76,10 +96,15 @@ class SkillLoader:
         if not self.skills_dir.exists():
             return skill_dirs
         
-        for item in self.skills_dir.iterdir():
-            if item.is_dir() and not item.name.startswith(('_', '.')):
-                skill_file = item / self.SKILL_FILENAME
-                if skill_file.exists():
+        # scandir entries carry the file type from the directory listing,
+        # so filtering out non-directories needs no extra stat calls
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(('_', '.')) or not entry.is_dir():
+                    continue
+                
+                item = Path(entry.path)
+                if (item / self.SKILL_FILENAME).exists():
                     skill_dirs.append(item)
         
         return skill_dirs
@@ -97,13 +122,11 @@ class SkillLoader:
         frontmatter = {}
         body = content
         
-        # Match frontmatter between --- delimiters
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(pattern, content, re.DOTALL)
+        match = self.FRONTMATTER_PATTERN.match(content)
         
         if match:
             try:
-                frontmatter = yaml.safe_load(match.group(1)) or {}
+                frontmatter = yaml.load(match.group(1), Loader=_YAML_LOADER) or {}
             except yaml.YAMLError:
                 frontmatter = {}
             body = match.group(2)
@@ -133,22 +156,15 @@ class SkillLoader:
             config_file = skill_dir / self.CONFIG_FILENAME
             if config_file.exists():
                 try:
-                    additional_config = yaml.safe_load(
-                        config_file.read_text(encoding='utf-8')
+                    additional_config = yaml.load(
+                        config_file.read_bytes(), Loader=_YAML_LOADER
                     ) or {}
                     frontmatter = {**frontmatter, **additional_config}
                 except yaml.YAMLError:
                     pass
             
             # Create skill config
-            config = SkillConfig(
-                name=frontmatter.get('name', skill_dir.name),
-                description=frontmatter.get('description', ''),
-                triggers=frontmatter.get('triggers', []),
-                allowed_tools=frontmatter.get('allowed_tools'),
-                priority=frontmatter.get('priority', 0),
-                category=frontmatter.get('category'),
-            )
+            config = SkillConfig.from_dict(frontmatter, name=skill_dir.name)
             
             return MarkdownSkill(config=config, content=body)
             
@@ -163,14 +179,8 @@ class SkillLoader:
         Returns:
             List of loaded skill instances
         """
-        skills = []
-        
-        for skill_dir in self.discover_skills():
-            skill = self.load_skill(skill_dir)
-            if skill:
-                skills.append(skill)
-        
-        return skills
+        skills = [self.load_skill(skill_dir) for skill_dir in self.discover_skills()]
+        return [skill for skill in skills if skill]
 
 
 class SkillRegistry:
@@ -292,9 +302,10 @@ class SkillRegistry:
         
         skills_to_check = self._skills.values()
         if skill_filter:
+            enabled = frozenset(skill_filter)
             skills_to_check = [
                 s for s in skills_to_check
-                if s.config.name in skill_filter
+                if s.config.name in enabled
             ]
         
         for skill in skills_to_check:
@@ -356,26 +367,39 @@ class SkillRegistry:
         if not matches:
             return "", []
         
-        prompts = []
-        skill_names = []
-        
-        for match in matches:
-            ctx = SkillContext(
+        prompts = [
+            match.skill.format_for_llm(SkillContext(
                 query=query,
                 matched_triggers=match.matched_triggers
-            )
-            prompts.append(match.skill.format_for_llm(ctx))
-            skill_names.append(match.skill.config.name)
+            ))
+            for match in matches
+        ]
+        skill_names = [match.skill.config.name for match in matches]
         
-        combined = "\n\n---\n\n".join(prompts)
+        header_lines = [
+            f"# Active Skills ({len(matches)})",
+            "",
+            "The following skills are relevant to this query:",
+        ]
+        header_lines.extend(f"- {name}" for name in skill_names)
+        header_lines.extend(["", "---", "", ""])
         
-        header = f"# Active Skills ({len(matches)})\n\n"
-        header += "The following skills are relevant to this query:\n"
-        for name in skill_names:
-            header += f"- {name}\n"
-        header += "\n---\n\n"
+        return "\n".join(header_lines) + "\n\n---\n\n".join(prompts), skill_names
+    
+    def copy(self) -> "SkillRegistry":
+        """
+        Create a shallow copy of the registry.
+        
+        Skill instances are shared with the original; registering or
+        unregistering skills on the copy does not affect it.
         
-        return header + combined, skill_names
+        Returns:
+            New SkillRegistry containing the same skills
+        """
+        registry = SkillRegistry()
+        registry._skills = dict(self._skills)
+        registry._loader = self._loader
+        return registry
     
     def __len__(self) -> int:
         return len(self._skills)
@@ -398,7 +422,7 @@ class SkillRegistry:
             self.register(skill)
         return skill
     
-    def register_from_yaml(self, yaml_string: str) -> tuple:
+    def register_from_yaml(self, yaml_string: str) -> Tuple[int, Optional[str]]:
         """
         Register skills from a YAML string.
         
@@ -424,7 +448,7 @@ class SkillRegistry:
             return (0, "Empty YAML string")
         
         try:
-            configs = yaml.safe_load(yaml_string)
+            configs = _parse_yaml_string(yaml_string)
             if configs is None:
                 return (0, "YAML parsed to None")
             
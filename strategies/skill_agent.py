@@ -10,6 +10,7 @@ system to provide intelligent, context-aware responses. The agent:
 4. Manages the conversation loop with iteration limits
 """
 
+import json
 import os
 import time
 from typing import Any, Dict, Generator, List, Optional, Tuple
@@ -17,10 +18,8 @@ from typing import Any, Dict, Generator, List, Optional, Tuple
 from pydantic import BaseModel
 
 from dify_plugin.entities.agent import AgentInvokeMessage
-from dify_plugin.entities.model.llm import LLMModelConfig
 from dify_plugin.entities.model.message import (
     PromptMessage,
-    PromptMessageRole,
     SystemPromptMessage,
     UserPromptMessage,
     AssistantPromptMessage,
@@ -32,6 +31,13 @@ from dify_plugin.interfaces.agent import AgentModelConfig, AgentStrategy, ToolEn
 from skills import SkillRegistry
 
 
+# Built-in skills live in the plugin's top-level skills/ directory
+SKILLS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'skills'
+)
+
+
 class SkillAgentParams(BaseModel):
     """Parameters for the skill-based agent strategy."""
     model: AgentModelConfig
@@ -69,27 +75,28 @@ When using tools:
 
 Always explain your reasoning and provide clear, actionable responses."""
 
+    # Built-in skills shared by every strategy instance. Dify creates a new
+    # strategy object per invocation, so these are loaded once per process.
+    _builtin_registry: Optional[SkillRegistry] = None
 
     def _ensure_skills_loaded(self) -> SkillRegistry:
         """
-        Ensure skills are loaded and return the registry.
+        Ensure skills are loaded and return a registry for this invocation.
+        
+        Built-in skills are read from disk only once; each call returns a
+        copy so that custom skills registered during an invocation do not
+        leak into later ones.
         
         Returns:
-            Initialized SkillRegistry with loaded skills
+            SkillRegistry containing the built-in skills
         """
-        # Lazy initialization since we cannot override __init__
-        if not hasattr(self, '_skill_registry') or self._skill_registry is None:
-            self._skill_registry = SkillRegistry()
-            
-            # Determine skills directory path
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            plugin_dir = os.path.dirname(current_dir)
-            skills_dir = os.path.join(plugin_dir, 'skills')
-            
-            # Load skills
-            count = self._skill_registry.load_from_directory(skills_dir)
-            
-        return self._skill_registry
+        cls = type(self)
+        if cls._builtin_registry is None:
+            registry = SkillRegistry()
+            registry.load_from_directory(SKILLS_DIR)
+            cls._builtin_registry = registry
+        
+        return cls._builtin_registry.copy()
     
     def _parse_enabled_skills(self, enabled_skills: str) -> Optional[List[str]]:
         """
@@ -122,9 +129,8 @@ Always explain your reasoning and provide clear, actionable responses."""
         if not tools:
             return []
         
-        definitions = []
-        for tool in tools:
-            definition = {
+        return [
+            {
                 "type": "function",
                 "function": {
                     "name": tool.identity.name,
@@ -132,34 +138,106 @@ Always explain your reasoning and provide clear, actionable responses."""
                     "parameters": tool.parameters or {}
                 }
             }
-            definitions.append(definition)
-        
-        return definitions
+            for tool in tools
+        ]
     
     def _extract_tool_calls(
         self,
-        response: Any
-    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        assistant_tool_calls: List[AssistantPromptMessage.ToolCall]
+    ) -> List[Tuple[str, str, Any]]:
         """
-        Extract tool calls from LLM response.
+        Extract tool calls collected from the LLM response.
         
         Args:
-            response: LLM response object
+            assistant_tool_calls: ToolCall objects streamed by the LLM,
+                each with a non-empty id
             
         Returns:
-            List of (tool_call_id, tool_name, arguments) tuples
+            List of (tool_call_id, tool_name, raw_arguments) tuples
         """
-        tool_calls = []
+        return [
+            (tc.id, tc.function.name, tc.function.arguments)
+            for tc in assistant_tool_calls
+        ]
+    
+    def _parse_tool_arguments(
+        self,
+        arguments: Any
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Decode tool-call arguments sent by the LLM.
         
-        if hasattr(response, 'tool_calls') and response.tool_calls:
-            for tc in response.tool_calls:
-                tool_calls.append((
-                    tc.id or f"call_{len(tool_calls)}",
-                    tc.function.name,
-                    tc.function.arguments or {}
-                ))
+        Args:
+            arguments: Raw arguments, normally a JSON object string
+            
+        Returns:
+            Tuple of (arguments dict, error_message) where error_message is
+            None on success or a description of why decoding failed
+        """
+        if not arguments:
+            return {}, None
+        
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments)
+            except json.JSONDecodeError as e:
+                return {}, f"Invalid tool arguments: {str(e)}"
+        
+        if not isinstance(arguments, dict):
+            return {}, (
+                "Invalid tool arguments: expected a JSON object, "
+                f"got {type(arguments).__name__}"
+            )
+        
+        return arguments, None
+    
+    def _finish_metadata(self, started_at: float) -> Dict[str, float]:
+        """
+        Build finish metadata for a log message.
+        
+        Args:
+            started_at: perf_counter value when the logged step started
+            
+        Returns:
+            Dict with finished_at and elapsed_time from a single clock read
+        """
+        finished_at = time.perf_counter()
+        return {
+            "finished_at": finished_at,
+            "elapsed_time": finished_at - started_at
+        }
+    
+    def _fail_tool_call(
+        self,
+        tool_log: AgentInvokeMessage,
+        tool_call_id: str,
+        error: str,
+        messages: List[PromptMessage]
+    ) -> Generator[AgentInvokeMessage, None, None]:
+        """
+        Report a failed tool call in its log and back to the model.
         
-        return tool_calls
+        Args:
+            tool_log: Log message created when the tool call started
+            tool_call_id: ID of the failed tool call
+            error: Description of the failure
+            messages: Conversation to append the error result to
+            
+        Yields:
+            The finished error log message
+        """
+        error_msg = f"Tool error: {error}"
+        yield self.finish_log_message(
+            log=tool_log,
+            data={"error": error_msg},
+            metadata={"finished_at": time.perf_counter()},
+            status=ToolInvokeMessage.LogMessage.LogStatus.ERROR
+        )
+        
+        messages.append(ToolPromptMessage(
+            content=error_msg,
+            tool_call_id=tool_call_id
+        ))
     
     def _invoke(
         self,
@@ -194,17 +272,12 @@ Always explain your reasoning and provide clear, actionable responses."""
                 yield self.create_text_message(
                     f"🔧 Custom skills parameter received ({len(params.custom_skills)} chars)\n"
                 )
-            result = registry.register_from_yaml(params.custom_skills)
-            # Handle both old (int) and new (tuple) return types
-            if isinstance(result, tuple):
-                custom_count, error_msg = result
-                if error_msg:
-                    # Always show errors
-                    yield self.create_text_message(
-                        f"⚠️ Custom skills error: {error_msg}\n"
-                    )
-            else:
-                custom_count = result
+            custom_count, error_msg = registry.register_from_yaml(params.custom_skills)
+            if error_msg:
+                # Always show errors
+                yield self.create_text_message(
+                    f"⚠️ Custom skills error: {error_msg}\n"
+                )
             
             if custom_count > 0 and params.debug_mode:
                 # Show newly loaded skill names
@@ -294,8 +367,10 @@ Always explain your reasoning and provide clear, actionable responses."""
             
             # Call LLM
             try:
-                response_text = ""
-                tool_calls = []
+                # Collect streamed deltas and join once; repeated str +=
+                # copies the whole response on every chunk
+                response_parts: List[str] = []
+                assistant_tool_calls: List[AssistantPromptMessage.ToolCall] = []
                 
                 for chunk in self.session.model.llm.invoke(
                     model_config=params.model,
@@ -308,24 +383,32 @@ Always explain your reasoning and provide clear, actionable responses."""
                         if hasattr(chunk.delta, 'message') and chunk.delta.message:
                             delta_content = chunk.delta.message.content
                             if delta_content:
-                                response_text += delta_content
+                                response_parts.append(delta_content)
                                 yield self.create_text_message(delta_content)
-                        
-                        # Check for tool calls
-                        if hasattr(chunk.delta, 'tool_calls'):
-                            tool_calls = self._extract_tool_calls(chunk.delta)
+                            
+                            # Collect tool calls across chunks, since parallel
+                            # calls may be streamed separately. The validated
+                            # ToolCall objects are reused in the assistant message
+                            for tc in chunk.delta.message.tool_calls or []:
+                                if not tc.id:
+                                    # The assistant turn and the tool result
+                                    # must share the same id
+                                    tc = tc.model_copy(update={
+                                        "id": f"call_{len(assistant_tool_calls)}"
+                                    })
+                                assistant_tool_calls.append(tc)
+                
+                response_text = "".join(response_parts)
+                tool_calls = self._extract_tool_calls(assistant_tool_calls)
                 
                 # Finish model log
                 yield self.finish_log_message(
                     log=model_log,
                     data={
                         "response_length": len(response_text),
-                        "has_tool_calls": len(tool_calls) > 0
+                        "has_tool_calls": bool(tool_calls)
                     },
-                    metadata={
-                        "finished_at": time.perf_counter(),
-                        "elapsed_time": time.perf_counter() - iteration_started
-                    }
+                    metadata=self._finish_metadata(iteration_started)
                 )
                 
                 # If no tool calls, we're done
@@ -333,36 +416,42 @@ Always explain your reasoning and provide clear, actionable responses."""
                     yield self.finish_log_message(
                         log=iteration_log,
                         data={"status": "completed", "response": response_text[:200]},
-                        metadata={
-                            "finished_at": time.perf_counter(),
-                            "elapsed_time": time.perf_counter() - iteration_started
-                        }
+                        metadata=self._finish_metadata(iteration_started)
                     )
                     break
                 
                 # Add assistant message with tool calls
                 messages.append(AssistantPromptMessage(
                     content=response_text,
-                    tool_calls=tool_calls
+                    tool_calls=assistant_tool_calls
                 ))
                 
                 # Execute tool calls
-                for tool_call_id, tool_name, tool_args in tool_calls:
+                for tool_call_id, tool_name, raw_args in tool_calls:
                     tool_log = self.create_log_message(
                         label=f"Tool: {tool_name}",
-                        data={"arguments": tool_args},
+                        data={"arguments": raw_args},
                         metadata={"started_at": time.perf_counter()},
                         status=ToolInvokeMessage.LogMessage.LogStatus.START,
                         parent=iteration_log
                     )
                     yield tool_log
                     
+                    tool_instance = tool_instances.get(tool_name)
+                    if tool_instance is None:
+                        yield from self._fail_tool_call(
+                            tool_log, tool_call_id, f"Unknown tool: {tool_name}", messages
+                        )
+                        continue
+                    
+                    tool_args, args_error = self._parse_tool_arguments(raw_args)
+                    if args_error:
+                        yield from self._fail_tool_call(
+                            tool_log, tool_call_id, args_error, messages
+                        )
+                        continue
+                    
                     try:
-                        if tool_name not in tool_instances:
-                            raise ValueError(f"Unknown tool: {tool_name}")
-                        
-                        tool_instance = tool_instances[tool_name]
-                        
                         # Invoke the tool
                         tool_result_parts = []
                         for result in self.session.tool.invoke(
@@ -392,18 +481,9 @@ Always explain your reasoning and provide clear, actionable responses."""
                         ))
                         
                     except Exception as e:
-                        error_msg = f"Tool error: {str(e)}"
-                        yield self.finish_log_message(
-                            log=tool_log,
-                            data={"error": error_msg},
-                            metadata={"finished_at": time.perf_counter()},
-                            status=ToolInvokeMessage.LogMessage.LogStatus.ERROR
+                        yield from self._fail_tool_call(
+                            tool_log, tool_call_id, str(e), messages
                         )
-                        
-                        messages.append(ToolPromptMessage(
-                            content=error_msg,
-                            tool_call_id=tool_call_id
-                        ))
                 
                 # Finish iteration log
                 yield self.finish_log_message(
@@ -412,10 +492,7 @@ Always explain your reasoning and provide clear, actionable responses."""
                         "status": "tool_calls_completed",
                         "tools_called": [tc[1] for tc in tool_calls]
                     },
-                    metadata={
-                        "finished_at": time.perf_counter(),
-                        "elapsed_time": time.perf_counter() - iteration_started
-                    }
+                    metadata=self._finish_metadata(iteration_started)
                 )
                 
             except Exception as e: